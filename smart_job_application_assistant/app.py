@@ -1,14 +1,94 @@
 from flask import Flask, request, render_template, jsonify, redirect, url_for, session
 from werkzeug.utils import secure_filename
+from resume_parser import PARSER_VERSION, ResumeParser
+from datetime import datetime
+import copy
+import functools
+import hashlib
+import json
 import os
+import tempfile
+import threading
 
 app = Flask(__name__)
 app.config['UPLOAD_FOLDER'] = 'uploads/'
+app.config['PARSED_CACHE_FOLDER'] = 'parsed_cache/'
+app.config['MAX_CONTENT_LENGTH'] = 10 * 1024 * 1024  # Reject uploads over 10MB
 app.secret_key = 'your_secret_key_here'  # Replace with a real secret key
 
-# Ensure upload folder exists
-if not os.path.exists(app.config['UPLOAD_FOLDER']):
-    os.makedirs(app.config['UPLOAD_FOLDER'])
+# Keep session data server-side in Redis when REDIS_URL is set (needs the
+# Flask-Session and redis packages); otherwise use the default cookie session
+if os.environ.get('REDIS_URL'):
+    from flask_session import Session
+    import redis
+    
+    app.config['SESSION_TYPE'] = 'redis'
+    app.config['SESSION_REDIS'] = redis.from_url(os.environ['REDIS_URL'])
+    Session(app)
+
+# Ensure upload and parsed cache folders exist
+for folder in (app.config['UPLOAD_FOLDER'], app.config['PARSED_CACHE_FOLDER']):
+    if not os.path.exists(folder):
+        os.makedirs(folder)
+
+# Resume parser, created on first use. Parsing is serialized because the
+# shared SpaCy model (and its memory zone) isn't safe across threads.
+parser = None
+parse_lock = threading.Lock()
+
+def get_parser():
+    global parser
+    if parser is None:
+        parser = ResumeParser()
+    return parser
+
+def parsed_cache_path(file_hash):
+    # Results from an older parser version are never reused
+    return os.path.join(app.config['PARSED_CACHE_FOLDER'], f'{file_hash}_{PARSER_VERSION}.json')
+
+@functools.lru_cache(maxsize=128)
+def load_cached_resume(file_hash):
+    # Raises on a miss or a corrupt entry, which lru_cache doesn't remember
+    with open(parsed_cache_path(file_hash), encoding='utf-8') as f:
+        return json.load(f)
+
+def save_cached_resume(file_hash, parsed_data):
+    # Write to a temp file and rename it into place so readers never see a
+    # partially written entry
+    fd, tmp_path = tempfile.mkstemp(dir=app.config['PARSED_CACHE_FOLDER'], suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'w', encoding='utf-8') as f:
+            json.dump(parsed_data, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, parsed_cache_path(file_hash))
+    except Exception:
+        os.remove(tmp_path)
+        raise
+
+def get_parsed_resume(file_path, file_hash, filename):
+    """Return parsed resume data, reusing earlier results for identical files."""
+    try:
+        parsed_data = copy.deepcopy(load_cached_resume(file_hash))
+    except (OSError, ValueError):
+        # Missing or unreadable cache entry: parse and (re)write it
+        with parse_lock:
+            parsed_data = get_parser().parse_resume(file_path)
+        try:
+            # Failed parses are cached too (as null) so they aren't retried
+            save_cached_resume(file_hash, parsed_data)
+        except OSError as e:
+            app.logger.error(f"Error caching parsed resume: {str(e)}")
+    
+    if not parsed_data:
+        return None
+    
+    # The cached entry may come from another upload of the same file
+    parsed_data['metadata']['filename'] = filename
+    parsed_data['metadata']['parsed_date'] = datetime.now().isoformat()
+    return parsed_data
+
+@app.errorhandler(413)
+def file_too_large(e):
+    return jsonify({'error': 'File too large'}), 413
 
 @app.route('/')
 def index():
@@ -61,9 +141,28 @@ def upload_file():
     if file:
         filename = secure_filename(file.filename)
         file_path = os.path.join(app.config['UPLOAD_FOLDER'], filename)
-        file.save(file_path)
+        # Stream to a private temp file in 1MB chunks, hashing the content as
+        # it goes, and parse that file so the hash always matches the bytes
+        sha256 = hashlib.sha256()
+        fd, tmp_path = tempfile.mkstemp(dir=app.config['UPLOAD_FOLDER'], suffix='.part')
+        try:
+            with os.fdopen(fd, 'wb') as fh:
+                for chunk in iter(lambda: file.stream.read(1 << 20), b''):
+                    sha256.update(chunk)
+                    fh.write(chunk)
+            file_hash = sha256.hexdigest()
+            
+            resume = None
+            if filename.lower().endswith('.pdf'):
+                resume = get_parsed_resume(tmp_path, file_hash, filename)
+            os.replace(tmp_path, file_path)
+        except Exception:
+            os.remove(tmp_path)
+            raise
+        
         session['resume_uploaded'] = True
-        return jsonify({'success': f'File {filename} uploaded successfully!'})
+        session['resume_hash'] = file_hash
+        return jsonify({'success': f'File {filename} uploaded successfully!', 'resume': resume})
 
 @app.route('/browse')
 def browse():
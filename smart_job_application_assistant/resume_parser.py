@@ -1,12 +1,44 @@
 import pdfplumber
 import re
-import spacy
 from pathlib import Path
-from typing import Dict, List, Optional
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 import logging
+import bisect
+import contextlib
+import functools
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from datetime import datetime
 
+# SpaCy is imported on first use so importing this module stays cheap
+if TYPE_CHECKING:
+    from spacy.tokens import Span
+
+# PyMuPDF extracts plain text natively; pdfplumber remains the fallback
+try:
+    import fitz
+except ImportError:
+    fitz = None
+
+# pyahocorasick scans for all education terms at once; fall back to substring checks
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+# orjson serializes much faster than the stdlib json module
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# google-re2 compiles the month alternation to a DFA; fall back to re if missing
+try:
+    import re2
+except ImportError:
+    re2 = None
+
 # Initialize logging
 logging.basicConfig(
     level=logging.INFO,
@@ -14,29 +46,128 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# Load SpaCy model
-try:
-    nlp = spacy.load("en_core_web_sm")
-except OSError:
-    logger.info("Downloading SpaCy model...")
-    spacy.cli.download("en_core_web_sm")
-    nlp = spacy.load("en_core_web_sm")
-
-def verify_pdf(pdf_path: str) -> bool:
-    """Verify PDF content can be read."""
+PARSER_VERSION = '1.0.0'
+
+# Only NER entity labels are used, so don't even deserialize the rest
+EXCLUDED_PIPES = ["tagger", "parser", "attribute_ruler", "lemmatizer"]
+
+@functools.lru_cache(maxsize=4)
+def _get_nlp(model: str = "en_core_web_sm"):
+    """Load a SpaCy model once per process."""
+    import spacy
+    
     try:
-        with pdfplumber.open(pdf_path) as pdf:
-            text = ''
-            for page in pdf.pages:
-                text += page.extract_text() + '\n'
-            logger.info("PDF Content Preview (first 500 chars):")
-            logger.info("-" * 50)
-            logger.info(text[:500])
-            logger.info("-" * 50)
-            return bool(text.strip())
+        return spacy.load(model, exclude=EXCLUDED_PIPES)
+    except OSError:
+        logger.info("Downloading SpaCy model...")
+        spacy.cli.download(model)
+        return spacy.load(model, exclude=EXCLUDED_PIPES)
+
+# SpaCy model, loaded on first use
+_nlp = None
+
+def get_nlp():
+    """Return the shared SpaCy model, loading it if needed."""
+    global _nlp
+    if _nlp is None:
+        _nlp = _get_nlp()
+    return _nlp
+
+# Regex patterns, compiled once at import
+_EMAIL_RE = re.compile(r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b')
+_PHONE_RE = re.compile(r'(?:\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}')
+_LINKEDIN_RE = re.compile(r'linkedin\.com/in/[\w-]+')
+_GITHUB_RE = re.compile(r'github\.com/[\w-]+')
+_DATE_RE = (re2 or re).compile(r'(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+\d{4}')
+_YEAR_RE = re.compile(r'(19|20)\d{2}|present|current', re.IGNORECASE)
+
+# Contact details sit in the first few lines of a resume
+CONTACT_HEADER_LINES = 6
+
+def contact_header(text: str) -> str:
+    """Return the first few lines of the resume, where NER looks for a location."""
+    return '\n'.join(text.split('\n', CONTACT_HEADER_LINES)[:CONTACT_HEADER_LINES])
+
+# Emails, phones and profile links almost always sit near the top of a resume
+CONTACT_HEAD_CHARS = 500
+
+def _search_head_first(pattern, text: str):
+    """Search the start of the text first, then the full text on a miss."""
+    match = pattern.search(text, 0, CONTACT_HEAD_CHARS)
+    if match:
+        # The cut-off may have shortened the match (the engine can backtrack
+        # to stop before it), so re-match from the same start on the full text
+        full_match = pattern.match(text, match.start())
+        if full_match:
+            return full_match
+    return pattern.search(text)
+
+# Joins the header and paragraphs for a single NER pass; never appears in a resume
+SEGMENT_SEPARATOR = '\n\n@@@SEP@@@\n\n'
+
+def _segment_bounds(segments: List[str], separator_length: int) -> List[Tuple[int, int]]:
+    """Return the (start, end) offsets of each segment in the joined text."""
+    bounds = []
+    offset = 0
+    for segment in segments:
+        bounds.append((offset, offset + len(segment)))
+        offset += len(segment) + separator_length
+    return bounds
+
+def _bucket_spans(spans, bounds: List[Tuple[int, int]]) -> List[List]:
+    """Group (start, end, value) spans by the segment they fall in."""
+    starts = [start for start, _ in bounds]
+    buckets = [[] for _ in bounds]
+    for start, end, value in spans:
+        index = bisect.bisect_right(starts, start) - 1
+        # Drop spans that run across a segment break
+        if index >= 0 and end <= bounds[index][1]:
+            buckets[index].append(value)
+    return buckets
+
+def _bucket_matches(pattern, text: str, bounds: List[Tuple[int, int]]) -> List[List[str]]:
+    """Run pattern over the whole text once and group matches by paragraph."""
+    matches = ((match.start(), match.end(), match.group()) for match in pattern.finditer(text))
+    return _bucket_spans(matches, bounds)
+
+def extract_text_with_fitz(pdf_path: str) -> Optional[str]:
+    """Extract plain text with PyMuPDF. Returns None if it can't be used."""
+    if fitz is None:
+        return None
+    try:
+        # get_text() ends each page with '\n'; strip it so page breaks are a
+        # single '\n' as with pdfplumber, not a paragraph break
+        with fitz.open(pdf_path) as doc:
+            return '\n'.join(page.get_text("text").rstrip('\n') for page in doc)
+    except Exception as e:
+        logger.warning(f"PyMuPDF could not read PDF, falling back to pdfplumber: {str(e)}")
+        return None
+
+def extract_text_with_pdfplumber(pdf_path: str) -> str:
+    """Extract plain text with pdfplumber, skipping pages with no text."""
+    with pdfplumber.open(pdf_path) as pdf:
+        # Collect pages and join once; pages with no text return None
+        parts = []
+        for page in pdf.pages:
+            page_text = page.extract_text()
+            if page_text:
+                parts.append(page_text)
+        return '\n'.join(parts)
+
+def verify_pdf(pdf_path: str) -> Optional[str]:
+    """Verify PDF content can be read. Returns the extracted text, or None."""
+    try:
+        text = extract_text_with_fitz(pdf_path)
+        if text is None:
+            text = extract_text_with_pdfplumber(pdf_path)
+        logger.info("PDF Content Preview (first 500 chars):")
+        logger.info("-" * 50)
+        logger.info(text[:500])
+        logger.info("-" * 50)
+        return text if text.strip() else None
     except Exception as e:
         logger.error(f"Error reading PDF: {str(e)}")
-        return False
+        return None
 
 class ResumeParser:
     def __init__(self):
@@ -50,29 +181,51 @@ class ResumeParser:
             'contact': r'(?i)(contact|personal details|contact information)'
         }
         
-        self.EMAIL_PATTERN = r'\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b'
-        self.PHONE_PATTERN = r'(?:\+\d{1,3}[-.\s]?)?\(?\d{3}\)?[-.\s]?\d{3}[-.\s]?\d{4}'
-        self.LINKEDIN_PATTERN = r'linkedin\.com/in/[\w-]+'
-        self.GITHUB_PATTERN = r'github\.com/[\w-]+'
-        self.DATE_PATTERN = r'(?:Jan(?:uary)?|Feb(?:ruary)?|Mar(?:ch)?|Apr(?:il)?|May|Jun(?:e)?|Jul(?:y)?|Aug(?:ust)?|Sep(?:tember)?|Oct(?:ober)?|Nov(?:ember)?|Dec(?:ember)?)\s+\d{4}'
-        
         self.EDUCATION_TERMS = [
             'bachelor', 'master', 'phd', 'doctorate', 'bs', 'ms', 'ba', 'ma',
             'b.tech', 'm.tech', 'b.e.', 'm.e.', 'b.sc', 'm.sc',
             'university', 'college', 'institute', 'school'
         ]
+        
+        # Same terms as one case-insensitive pattern, used without pyahocorasick
+        self.education_pattern = re.compile(
+            '|'.join(map(re.escape, self.EDUCATION_TERMS)), re.IGNORECASE
+        )
+        
+        # One automaton over all education terms, scanned once per paragraph
+        self.education_automaton = None
+        if ahocorasick is not None:
+            self.education_automaton = ahocorasick.Automaton()
+            for term in self.EDUCATION_TERMS:
+                self.education_automaton.add_word(term, term)
+            self.education_automaton.make_automaton()
 
     def extract_text_from_pdf(self, pdf_path: str) -> str:
         """Extract text from PDF file."""
-        try:
-            with pdfplumber.open(pdf_path) as pdf:
-                text = '\n'.join(page.extract_text() for page in pdf.pages)
+        text = extract_text_with_fitz(pdf_path)
+        if text is not None:
             return text
+        try:
+            return extract_text_with_pdfplumber(pdf_path)
         except Exception as e:
             logger.error(f"Error extracting text from PDF: {str(e)}")
             return ""
 
-    def extract_contact_info(self, text: str) -> Dict[str, Optional[str]]:
+    def process_text(self, text: str) -> Tuple[List['Span'], List[Tuple[str, List['Span']]]]:
+        """Run SpaCy once over the contact header and all paragraphs joined together."""
+        paragraphs = text.split('\n\n')
+        segments = [contact_header(text)] + paragraphs
+        doc = get_nlp()(SEGMENT_SEPARATOR.join(segments))
+        
+        # Assign each entity back to the segment it came from by offset
+        bounds = _segment_bounds(segments, len(SEGMENT_SEPARATOR))
+        segment_ents = _bucket_spans(
+            ((ent.start_char, ent.end_char, ent) for ent in doc.ents), bounds
+        )
+        
+        return segment_ents[0], list(zip(paragraphs, segment_ents[1:]))
+
+    def extract_contact_info(self, text: str, ents: Optional[List['Span']] = None) -> Dict[str, Optional[str]]:
         """Extract contact information."""
         contact_info = {
             'email': None,
@@ -83,132 +236,173 @@ class ResumeParser:
         }
         
         # Extract email
-        email_match = re.search(self.EMAIL_PATTERN, text)
+        email_match = _search_head_first(_EMAIL_RE, text)
         if email_match:
             contact_info['email'] = email_match.group()
         
         # Extract phone
-        phone_match = re.search(self.PHONE_PATTERN, text)
+        phone_match = _search_head_first(_PHONE_RE, text)
         if phone_match:
             contact_info['phone'] = phone_match.group()
         
         # Extract LinkedIn
-        linkedin_match = re.search(self.LINKEDIN_PATTERN, text)
+        linkedin_match = _search_head_first(_LINKEDIN_RE, text)
         if linkedin_match:
             contact_info['linkedin'] = linkedin_match.group()
         
         # Extract GitHub
-        github_match = re.search(self.GITHUB_PATTERN, text)
+        github_match = _search_head_first(_GITHUB_RE, text)
         if github_match:
             contact_info['github'] = github_match.group()
         
         # Extract location using SpaCy
-        doc = nlp(text[:1000])
-        for ent in doc.ents:
+        if ents is None:
+            ents = get_nlp()(contact_header(text)).ents
+        for ent in ents:
             if ent.label_ in ['GPE', 'LOC']:
                 contact_info['location'] = ent.text
                 break
         
         return contact_info
 
-    def extract_education(self, text: str) -> List[Dict[str, str]]:
-        """Extract education information."""
-        education_list = []
-        paragraphs = text.split('\n\n')
+    def find_degree_line(self, paragraph: str) -> Optional[int]:
+        """Return the index of the first line containing an education term."""
+        if self.education_automaton is not None:
+            # Matches come back in order of end position, so the first one
+            # is on the earliest matching line
+            lowered = paragraph.lower()
+            for end, _ in self.education_automaton.iter(lowered):
+                return lowered.count('\n', 0, end)
+            return None
         
-        for paragraph in paragraphs:
-            if any(term in paragraph.lower() for term in self.EDUCATION_TERMS):
-                education_info = {
-                    'degree': None,
-                    'institution': None,
-                    'graduation_date': None,
-                    'gpa': None
-                }
-                
-                # Extract dates
-                dates = re.findall(self.DATE_PATTERN, paragraph)
-                if dates:
-                    education_info['graduation_date'] = dates[-1]
-                
-                # Extract institution
-                doc = nlp(paragraph)
-                for ent in doc.ents:
-                    if ent.label_ == 'ORG':
-                        education_info['institution'] = ent.text
-                        break
-                
-                # Extract degree
-                lines = paragraph.split('\n')
-                for line in lines:
-                    if any(term in line.lower() for term in self.EDUCATION_TERMS):
-                        education_info['degree'] = line.strip()
-                        break
-                
-                if education_info['degree'] or education_info['institution']:
-                    education_list.append(education_info)
+        # Case-insensitive scan of the original text, no lowered copy needed
+        match = self.education_pattern.search(paragraph)
+        if match:
+            return paragraph.count('\n', 0, match.start())
+        return None
+
+    def extract_education(self, paragraph: str, ents: List['Span'], dates: List[str]) -> Optional[Dict[str, str]]:
+        """Extract education information from a single paragraph."""
+        degree_line = self.find_degree_line(paragraph)
+        if degree_line is None:
+            return None
         
-        return education_list
+        education_info = {
+            'degree': None,
+            'institution': None,
+            'graduation_date': None,
+            'gpa': None
+        }
+        
+        # Extract dates
+        if dates:
+            education_info['graduation_date'] = dates[-1]
+        
+        # Extract institution
+        for ent in ents:
+            if ent.label_ == 'ORG':
+                education_info['institution'] = ent.text
+                break
+        
+        # Extract degree
+        education_info['degree'] = paragraph.split('\n')[degree_line].strip()
+        
+        if education_info['degree'] or education_info['institution']:
+            return education_info
+        return None
+
+    def extract_experience(self, paragraph: str, ents: List['Span'], dates: List[str],
+                           years: List[str]) -> Optional[Dict[str, any]]:
+        """Start a work experience entry if the paragraph contains a date."""
+        if not years:
+            return None
+        
+        experience_info = {
+            'title': None,
+            'company': None,
+            'dates': [],
+            'description': []
+        }
+        
+        # Extract dates
+        if dates:
+            experience_info['dates'] = dates
+        
+        # Extract company
+        for ent in ents:
+            if ent.label_ == 'ORG':
+                experience_info['company'] = ent.text
+                break
+        
+        # First line is usually the title
+        lines = paragraph.split('\n')
+        if lines:
+            experience_info['title'] = lines[0].strip()
+        
+        return experience_info
 
-    def extract_experience(self, text: str) -> List[Dict[str, any]]:
-        """Extract work experience information."""
+    def parse_all(self, text: str) -> Dict:
+        """Extract contact, education and experience in a single pass over paragraphs."""
+        # Run NER over the header and every paragraph in one pass
+        contact_ents, paragraphs = self.process_text(text)
+        
+        contact_info = self.extract_contact_info(text, contact_ents)
+        education_list = []
         experience_list = []
-        paragraphs = text.split('\n\n')
         current_experience = None
         
-        for paragraph in paragraphs:
-            if re.search(r'(19|20)\d{2}|present|current', paragraph.lower()):
+        # Scan the full text for dates/years once, then assign them to
+        # paragraphs by offset ('\n\n' separators are 2 chars)
+        bounds = _segment_bounds([paragraph for paragraph, _ in paragraphs], 2)
+        paragraph_dates = _bucket_matches(_DATE_RE, text, bounds)
+        paragraph_years = _bucket_matches(_YEAR_RE, text, bounds)
+        
+        for (paragraph, ents), dates, years in zip(paragraphs, paragraph_dates, paragraph_years):
+            education_info = self.extract_education(paragraph, ents, dates)
+            if education_info:
+                education_list.append(education_info)
+            
+            experience_info = self.extract_experience(paragraph, ents, dates, years)
+            if experience_info:
                 if current_experience:
                     experience_list.append(current_experience)
-                current_experience = {
-                    'title': None,
-                    'company': None,
-                    'dates': [],
-                    'description': []
-                }
-                
-                # Extract dates
-                dates = re.findall(self.DATE_PATTERN, paragraph)
-                if dates:
-                    current_experience['dates'] = dates
-                
-                # Extract company
-                doc = nlp(paragraph)
-                for ent in doc.ents:
-                    if ent.label_ == 'ORG':
-                        current_experience['company'] = ent.text
-                        break
-                
-                # First line is usually the title
-                lines = paragraph.split('\n')
-                if lines:
-                    current_experience['title'] = lines[0].strip()
-            
+                current_experience = experience_info
             elif current_experience:
                 current_experience['description'].append(paragraph.strip())
         
         if current_experience:
             experience_list.append(current_experience)
         
-        return experience_list
+        return {
+            'contact_info': contact_info,
+            'education': education_list,
+            'experience': experience_list
+        }
 
     def parse_resume(self, pdf_path: str) -> Dict:
         """Main function to parse resume."""
+        # Extract text from PDF
+        text = self.extract_text_from_pdf(pdf_path)
+        if not text:
+            logger.error("Error parsing resume: No text could be extracted from the PDF")
+            return None
+        
+        return self.parse_resume_from_text(text, pdf_path)
+
+    def parse_resume_from_text(self, text: str, pdf_path: str) -> Dict:
+        """Parse resume from already extracted PDF text."""
         try:
-            # Extract text from PDF
-            text = self.extract_text_from_pdf(pdf_path)
-            if not text:
-                raise ValueError("No text could be extracted from the PDF")
-
-            # Parse each section
-            parsed_data = {
-                'contact_info': self.extract_contact_info(text),
-                'education': self.extract_education(text),
-                'experience': self.extract_experience(text),
-                'metadata': {
-                    'filename': Path(pdf_path).name,
-                    'parsed_date': datetime.now().isoformat(),
-                    'parser_version': '1.0.0'
-                }
+            # Free Vocab entries added for this resume once we're done with it
+            # (SpaCy >= 3.8). Only plain strings may leave this block.
+            nlp = get_nlp()
+            memory_zone = getattr(nlp, 'memory_zone', contextlib.nullcontext)
+            with memory_zone():
+                parsed_data = self.parse_all(text)
+
+            parsed_data['metadata'] = {
+                'filename': Path(pdf_path).name,
+                'parsed_date': datetime.now().isoformat(),
+                'parser_version': PARSER_VERSION
             }
             
             return parsed_data
@@ -220,12 +414,49 @@ class ResumeParser:
     def save_to_json(self, parsed_data: Dict, output_path: str):
         """Save parsed resume data to JSON file."""
         try:
-            with open(output_path, 'w', encoding='utf-8') as f:
-                json.dump(parsed_data, f, indent=2, ensure_ascii=False)
+            if orjson is not None:
+                Path(output_path).write_bytes(
+                    orjson.dumps(parsed_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+                )
+            else:
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    json.dump(parsed_data, f, indent=2, ensure_ascii=False)
             logger.info(f"Successfully saved parsed data to {output_path}")
         except Exception as e:
             logger.error(f"Error saving to JSON: {str(e)}")
 
+# Per-process parser, created on first use inside each worker
+_worker_parser = None
+
+def _process_one(pdf_path: str, output_dir: str) -> bool:
+    """Verify, parse and save a single PDF. Runs inside a worker process."""
+    global _worker_parser
+    if _worker_parser is None:
+        _worker_parser = ResumeParser()
+    
+    pdf_file = Path(pdf_path)
+    logger.info(f"\nProcessing: {pdf_file.name}")
+    logger.info("Verifying PDF content...")
+    
+    # verify_pdf returns the extracted text so the PDF is only read once
+    text = verify_pdf(pdf_path)
+    if not text:
+        logger.error(f"Could not read content from {pdf_file.name}")
+        return False
+        
+    try:
+        parsed_data = _worker_parser.parse_resume_from_text(text, pdf_path)
+        if parsed_data:
+            output_path = Path(output_dir) / f"{pdf_file.stem}_parsed.json"
+            _worker_parser.save_to_json(parsed_data, str(output_path))
+            logger.info(f"Successfully parsed and saved to {output_path}")
+            return True
+        logger.error(f"Failed to parse {pdf_file.name}")
+        return False
+    except Exception as e:
+        logger.error(f"Error processing {pdf_file.name}: {str(e)}")
+        return False
+
 def main():
     """Main function to run the resume parser."""
     # Set up paths
@@ -237,9 +468,6 @@ def main():
     input_dir.mkdir(exist_ok=True)
     output_dir.mkdir(exist_ok=True)
     
-    # Initialize parser
-    parser = ResumeParser()
-    
     # Get list of PDF files
     pdf_files = list(input_dir.glob("*.pdf"))
     
@@ -249,32 +477,26 @@ def main():
     
     logger.info(f"Found {len(pdf_files)} PDF files to process")
     
-    # Process each PDF file
+    # Process PDF files in parallel, one worker per core (capped at 6)
     success_count = 0
     failed_count = 0
+    max_workers = min(os.cpu_count() or 1, 6, len(pdf_files))
     
-    for pdf_file in pdf_files:
-        logger.info(f"\nProcessing: {pdf_file.name}")
-        logger.info("Verifying PDF content...")
-        
-        if not verify_pdf(str(pdf_file)):
-            logger.error(f"Could not read content from {pdf_file.name}")
-            failed_count += 1
-            continue
-            
-        try:
-            parsed_data = parser.parse_resume(str(pdf_file))
-            if parsed_data:
-                output_path = output_dir / f"{pdf_file.stem}_parsed.json"
-                parser.save_to_json(parsed_data, str(output_path))
-                success_count += 1
-                logger.info(f"Successfully parsed and saved to {output_path}")
-            else:
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(_process_one, str(pdf_file), str(output_dir)): pdf_file
+            for pdf_file in pdf_files
+        }
+        for future in as_completed(futures):
+            pdf_file = futures[future]
+            try:
+                if future.result():
+                    success_count += 1
+                else:
+                    failed_count += 1
+            except Exception as e:
                 failed_count += 1
-                logger.error(f"Failed to parse {pdf_file.name}")
-        except Exception as e:
-            failed_count += 1
-            logger.error(f"Error processing {pdf_file.name}: {str(e)}")
+                logger.error(f"Error processing {pdf_file.name}: {str(e)}")
     
     # Print summary
     logger.info("\nProcessing complete:")